@@ -9,11 +9,76 @@ Data Checker for CSV and Excel Files
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 import json
+import multiprocessing
+import os
 
+try:
+    import polars as pl
+except ImportError:  # polarsはオプション（engine='polars' の場合のみ必要）
+    pl = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pv
+    import pyarrow.parquet as pq
+    # 文字列列はPyArrowの文字列型で保持する（Null判定・ユニーク数の計算が高速）
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = None
+    _STRING_DTYPE = 'string'
+
+try:
+    import cudf
+except ImportError:  # cudfはオプション（engine='cudf' の場合のみ必要）
+    cudf = None
+
+try:
+    import orjson
+except ImportError:  # orjsonはオプション（無い場合は標準のjsonで出力）
+    orjson = None
+
+try:
+    import python_calamine  # noqa: F401
+    # Rust製の高速なExcelパーサーが使える場合はそちらを優先する
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_ENGINE = None
+
+try:
+    from numba import njit, prange, types
+except ImportError:  # numbaはオプション（無い場合はNumPyで計算）
+    njit = None
+    prange = range
+
+# 並列チェック用のプロセスの起動方法（forkserverが無い環境ではspawn）
+_POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# 拡張子とファイルタイプの対応
+_EXT_MAP = {
+    '.csv': 'csv',
+    '.xlsx': 'excel',
+    '.xls': 'excel',
+}
+
+# PyArrowのCSVパーサーが1スレッドで処理するブロックサイズ（型推論もこの単位で行われる）
+_ARROW_CSV_BLOCK_SIZE = 8 << 20
+
+# 行インデックス用の一時列名（polarsエンジンで使用）
+_ROW_INDEX_COLUMN = '__data_check_row__'
+
+# numbaのカーネルを使用する最小の要素数（小さい配列ではスレッド起動のコストが上回る）
+_NUMBA_MIN_SIZE = 100_000
+
+
+@lru_cache(maxsize=1024)
 def detect_file_type(filepath: str) -> str:
     """
     ファイルの拡張子からファイルタイプを判別する
@@ -27,56 +92,321 @@ def detect_file_type(filepath: str) -> str:
     Raises:
         ValueError: サポートされていないファイルタイプの場合
     """
-    ext = Path(filepath).suffix.lower()
+    ext = os.path.splitext(filepath)[1].lower()
     
-    if ext == '.csv':
-        return 'csv'
-    elif ext in ['.xlsx', '.xls']:
-        return 'excel'
-    else:
+    file_type = _EXT_MAP.get(ext)
+    
+    if file_type is None:
         raise ValueError(f"サポートされていないファイルタイプ: {ext}")
+    return file_type
+
+
+def infer_csv_dtypes(filepath: str, columns: List[str] = None,
+                     sample_rows: int = 10_000) -> Dict[str, str]:
+    """
+    CSVファイルの先頭を読み込んで列の型を推定する
+
+    整数列は 'Int64'、浮動小数点列は 'Float64'、文字列列は PyArrow の文字列型
+    （pyarrowが無い場合は 'string'）とし、object型による低速な処理を避ける。
+    それ以外の型（真偽値など）は推論に任せるため含めない。
+
+    Args:
+        filepath: CSVファイルのパス
+        columns: 対象の列名のリスト（省略時は全列）
+        sample_rows: 型の推定に使用する行数
+
+    Returns:
+        列名をキーとした型指定の辞書
+    """
+    sample = pd.read_csv(filepath, usecols=columns, nrows=sample_rows)
+    dtype = {}
+
+    for column, series in sample.items():
+        if pd.api.types.is_bool_dtype(series):
+            continue
+        elif pd.api.types.is_integer_dtype(series):
+            dtype[column] = 'Int64'
+        elif pd.api.types.is_float_dtype(series):
+            dtype[column] = 'Float64'
+        elif pd.api.types.is_string_dtype(series):
+            dtype[column] = _STRING_DTYPE
+
+    return dtype
+
+
+def _temporal_string_types(schema: "pa.Schema") -> Dict[str, "pa.DataType"]:
+    """
+    日付・時刻型と推論された列を文字列型で読み込むための型指定を返す
+
+    PyArrowのCSVパーサーは '2024-01-01' のような値を日付型に変換するが、
+    pandasのCSVパーサーと同様に元の文字列のまま扱う（結果のJSON出力にも使える）。
+
+    Args:
+        schema: 推論されたArrowのスキーマ
+
+    Returns:
+        列名をキーとした型指定の辞書（日付・時刻型の列が無ければ空）
+    """
+    return {field.name: pa.string() for field in schema if pa.types.is_temporal(field.type)}
+
+
+def _arrow_csv_options(filepath: str, columns: List[str] = None) -> Dict:
+    """
+    PyArrowのCSVリーダーに渡す読み込みオプションを作成する
+
+    先頭のブロックから型を推論し、日付・時刻型と推論された列は文字列として
+    読み込むように型を指定する。
+
+    Args:
+        filepath: CSVファイルのパス
+        columns: 読み込む列名のリスト（省略時は全列）
+
+    Returns:
+        read_options と convert_options をキーとした辞書
+    """
+    read_options = pv.ReadOptions(use_threads=True, block_size=_ARROW_CSV_BLOCK_SIZE)
+    # pandasと同様に空文字列をNullとして扱う
+    convert_options = pv.ConvertOptions(include_columns=columns, strings_can_be_null=True)
+    schema = pv.open_csv(filepath, read_options=read_options, convert_options=convert_options).schema
+    convert_options.column_types = _temporal_string_types(schema)
+    return {'read_options': read_options, 'convert_options': convert_options}
+
+
+def _iter_csv_arrow_chunks(filepath: str, chunksize: int, usecols: List[str] = None,
+                           nrows: int = None):
+    """
+    PyArrowのストリーミングCSVリーダーで、chunksize 行以下のDataFrameを順に返す
+
+    Args:
+        filepath: CSVファイルのパス
+        chunksize: 1チャンクあたりの最大行数
+        usecols: 読み込む列名のリスト（省略時は全列）
+        nrows: 先頭から読み込む行数（省略時は全行）
+
+    Yields:
+        各列がArrowDtypeのDataFrame（行インデックスは元のファイルでの行番号）
+    """
+    offset = 0
+    for batch in pv.open_csv(filepath, **_arrow_csv_options(filepath, usecols)):
+        if nrows is not None:
+            if offset >= nrows:
+                break
+            batch = batch.slice(0, nrows - offset)
+        for start in range(0, batch.num_rows, chunksize):
+            chunk = batch.slice(start, chunksize).to_pandas(types_mapper=pd.ArrowDtype)
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
+
+def _read_csv_arrow(filepath: str, columns: List[str] = None) -> pd.DataFrame:
+    """
+    PyArrowのマルチスレッドCSVパーサーで読み込み、Arrow形式のDataFrameを返す
+
+    日付・時刻型と推論される列は文字列として読み込む。
 
+    Args:
+        filepath: CSVファイルのパス
+        columns: 読み込む列名のリスト（省略時は全列）
+
+    Returns:
+        各列がArrowDtypeのDataFrame
+    """
+    table = pv.read_csv(filepath, **_arrow_csv_options(filepath, columns))
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _read_csv_typed(filepath: str, dtype: Dict[str, str] = None, **kwargs):
+    """
+    型指定付きでCSVファイルを読み込む
+
+    pyarrowがインストールされている場合は、PyArrowのCSVパーサーで読み込み、
+    各列をArrow形式（ArrowDtype）で保持する。型指定と行数の指定が無ければ
+    pyarrow.csv を直接使用する。
+    pyarrowが無い場合や読み込みに失敗した場合は、型指定が省略されていれば
+    infer_csv_dtypes で推定した型を使用する。推定した型で読み込めない場合
+    （先頭以降に小数や文字列が現れた場合など）はpandasの型推論で読み込み直す。
+
+    Args:
+        filepath: CSVファイルのパス
+        dtype: 列名をキーとした型指定の辞書
+        **kwargs: read_csv に渡すその他の引数
+
+    Returns:
+        read_csv の戻り値
+    """
+    if pa is not None and dtype is None and kwargs.get('nrows') is None:
+        try:
+            return _read_csv_arrow(filepath, columns=kwargs.get('usecols'))
+        except (ValueError, TypeError, pa.ArrowException):
+            pass
+
+    if pa is not None:
+        # PyArrowのCSVパーサーは nrows に対応していないため、その場合はCパーサーを使う
+        engine = 'pyarrow' if kwargs.get('nrows') is None else 'c'
+        try:
+            return pd.read_csv(filepath, engine=engine, dtype_backend='pyarrow', dtype=dtype, **kwargs)
+        except (ValueError, TypeError, pa.ArrowException):
+            pass
 
-def load_csv_data(filepath: str) -> Dict[str, pd.DataFrame]:
+    if dtype is not None:
+        return pd.read_csv(filepath, dtype=dtype, **kwargs)
+
+    inferred = infer_csv_dtypes(filepath, columns=kwargs.get('usecols'))
+    try:
+        return pd.read_csv(filepath, dtype=inferred, **kwargs)
+    except (ValueError, TypeError):
+        return pd.read_csv(filepath, **kwargs)
+
+
+def load_csv_data(filepath: str, columns: List[str] = None, nrows: int = None,
+                  dtype: Dict[str, str] = None) -> Dict[str, pd.DataFrame]:
     """
     CSVファイルを読み込む
     
     Args:
         filepath: CSVファイルのパス
+        columns: 読み込む列名のリスト（省略時は全列）
+        nrows: 先頭から読み込む行数（省略時は全行）
+        dtype: 列名をキーとした型指定の辞書（省略時は先頭の行から推定）
         
     Returns:
         シート名をキーとしたDataFrameの辞書（CSVの場合はファイル名がキー）
     """
     filename = Path(filepath).stem
-    df = pd.read_csv(filepath)
+    df = _read_csv_typed(filepath, dtype, usecols=columns, nrows=nrows)
     return {filename: df}
 
 
-def load_excel_data(filepath: str) -> Dict[str, pd.DataFrame]:
+def _excel_cache_dir(filepath: str) -> Path:
+    """
+    Excelファイルに対応するParquetキャッシュのディレクトリを返す
+
+    Args:
+        filepath: Excelファイルのパス
+
+    Returns:
+        キャッシュディレクトリのパス（例: data.xlsx -> data.xlsx.cache）
+    """
+    path = Path(filepath)
+    return path.with_name(f"{path.name}.cache")
+
+
+def _read_excel_cache(filepath: str, columns: List[str] = None,
+                      nrows: int = None) -> Dict[str, pd.DataFrame]:
+    """
+    有効なParquetキャッシュがあれば読み込む
+
+    Args:
+        filepath: Excelファイルのパス
+        columns: 読み込む列名のリスト（シートに存在しない列は無視）
+        nrows: 先頭から読み込む行数
+
+    Returns:
+        シート名をキーとしたDataFrameの辞書。キャッシュが無いか古い場合はNone
+    """
+    manifest = _excel_cache_dir(filepath) / 'sheets.json'
+    if pa is None or not manifest.exists() \
+            or manifest.stat().st_mtime < Path(filepath).stat().st_mtime:
+        return None
+
+    try:
+        sheet_names = json.loads(manifest.read_text(encoding='utf-8'))
+        data_dict = {}
+        for i, sheet_name in enumerate(sheet_names):
+            path = manifest.parent / f"{i}.parquet"
+            sheet_columns = None
+            if columns is not None:
+                # 指定された列だけをParquetから読み込む（順序はシートの列順に合わせる）
+                sheet_columns = [column for column in pq.read_schema(path).names if column in columns]
+            df = pd.read_parquet(path, columns=sheet_columns)
+            data_dict[sheet_name] = df.head(nrows) if nrows is not None else df
+        return data_dict
+    except (OSError, ValueError, ImportError):
+        return None
+
+
+def _write_excel_cache(filepath: str, data_dict: Dict[str, pd.DataFrame]) -> None:
+    """
+    読み込んだシートをParquetキャッシュとして保存する
+
+    列名が文字列でない、型が混在しているなどParquetに変換できない場合は
+    キャッシュを作成せずに終了する。
+
+    Args:
+        filepath: Excelファイルのパス
+        data_dict: シート名をキーとしたDataFrameの辞書
+    """
+    if not all(isinstance(column, str) for df in data_dict.values() for column in df.columns):
+        # Parquetでは列名が文字列に変換され、キャッシュから読み込んだ列名が変わってしまう
+        return
+
+    cache_dir = _excel_cache_dir(filepath)
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        for i, df in enumerate(data_dict.values()):
+            df.to_parquet(cache_dir / f"{i}.parquet", compression='zstd')
+        # マニフェストは最後に書き込み、その更新時刻でキャッシュの有効性を判定する
+        (cache_dir / 'sheets.json').write_text(
+            json.dumps(list(data_dict.keys()), ensure_ascii=False), encoding='utf-8'
+        )
+    except Exception:
+        # キャッシュは高速化のためだけなので、作成に失敗しても読み込みは続行する
+        pass
+
+
+def load_excel_data(filepath: str, cache: bool = False, columns: List[str] = None,
+                    nrows: int = None, dtype: Dict[str, str] = None) -> Dict[str, pd.DataFrame]:
     """
     Excelファイルの全シートを読み込む
+
+    python-calamine がインストールされていれば高速なcalamineエンジンを使用する。
     
     Args:
         filepath: Excelファイルのパス
+        cache: Trueの場合、読み込んだシートをParquet形式でキャッシュし、
+            Excelファイルが更新されていなければ次回以降はキャッシュから読み込む
+            （pyarrowが必要）
+        columns: 読み込む列名のリスト（省略時は全列。シートに存在しない列は無視）
+        nrows: 各シートの先頭から読み込む行数（省略時は全行）
+        dtype: 列名をキーとした型指定の辞書（省略時は推論）
         
     Returns:
         シート名をキーとしたDataFrameの辞書
     """
-    excel_file = pd.ExcelFile(filepath)
+    if cache and dtype is None:
+        data_dict = _read_excel_cache(filepath, columns=columns, nrows=nrows)
+        if data_dict is not None:
+            return data_dict
+
+    # シートごとに列構成が異なるため、存在しない列を無視できるよう関数で指定する
+    usecols = (lambda column: column in columns) if columns is not None else None
+
+    excel_file = pd.ExcelFile(filepath, engine=_EXCEL_ENGINE)
     data_dict = {}
     
     for sheet_name in excel_file.sheet_names:
-        data_dict[sheet_name] = pd.read_excel(excel_file, sheet_name=sheet_name)
+        data_dict[sheet_name] = pd.read_excel(excel_file, sheet_name=sheet_name,
+                                              usecols=usecols, nrows=nrows, dtype=dtype)
+
+    # 一部の列・行だけを読み込んだ場合や型を指定した場合はキャッシュを作成しない
+    if cache and columns is None and nrows is None and dtype is None:
+        _write_excel_cache(filepath, data_dict)
     
     return data_dict
 
 
-def load_data(filepath: str) -> Dict[str, pd.DataFrame]:
+def load_data(filepath: str, cache: bool = False, columns: List[str] = None,
+              nrows: int = None, dtype: Dict[str, str] = None) -> Dict[str, pd.DataFrame]:
     """
     ファイルタイプを自動判別してデータを読み込む
     
     Args:
         filepath: ファイルパス
+        cache: Excelファイルの場合、Parquetキャッシュを使用するかどうか
+        columns: 読み込む列名のリスト（省略時は全列）
+        nrows: 先頭から読み込む行数（省略時は全行）
+        dtype: 列名をキーとした型指定の辞書（省略時はCSVは推定、Excelは推論）
         
     Returns:
         シート名をキーとしたDataFrameの辞書
@@ -84,9 +414,417 @@ def load_data(filepath: str) -> Dict[str, pd.DataFrame]:
     file_type = detect_file_type(filepath)
     
     if file_type == 'csv':
-        return load_csv_data(filepath)
+        return load_csv_data(filepath, columns=columns, nrows=nrows, dtype=dtype)
     else:  # excel
-        return load_excel_data(filepath)
+        return load_excel_data(filepath, cache=cache, columns=columns, nrows=nrows, dtype=dtype)
+
+
+def _first_indices(index: pd.Index, mask: np.ndarray, limit: int = 100) -> list:
+    """
+    マスクがTrueの位置の行インデックスを先頭から limit 件まで返す
+
+    記録する件数分の位置だけを行インデックスに変換する。
+
+    Args:
+        index: 行インデックス
+        mask: 対象の位置がTrueの真偽値配列
+        limit: 返す最大件数
+
+    Returns:
+        行インデックスのリスト
+    """
+    return index[np.flatnonzero(mask)[:limit]].tolist()
+
+
+def _sample_csv_arrow(filepath: str, fraction: float, rng: np.random.Generator,
+                      columns: List[str] = None, nrows: int = None) -> pd.DataFrame:
+    """
+    PyArrowのストリーミングCSVリーダーでブロックごとに行を無作為抽出する
+
+    Args:
+        filepath: CSVファイルのパス
+        fraction: 抽出する行の割合
+        rng: 乱数生成器
+        columns: 読み込む列名のリスト（省略時は全列）
+        nrows: 抽出の対象とする先頭の行数（省略時は全行）
+
+    Returns:
+        抽出した行のDataFrame（行インデックスは元のファイルでの行番号）
+    """
+    reader = pv.open_csv(filepath, **_arrow_csv_options(filepath, columns))
+    batches = []
+    positions = []
+    offset = 0
+
+    for batch in reader:
+        if nrows is not None:
+            if offset >= nrows:
+                break
+            batch = batch.slice(0, nrows - offset)
+        keep = rng.random(batch.num_rows) < fraction
+        batches.append(batch.filter(pa.array(keep)))
+        positions.append(np.flatnonzero(keep) + offset)
+        offset += batch.num_rows
+
+    df = pa.Table.from_batches(batches, schema=reader.schema).to_pandas(types_mapper=pd.ArrowDtype)
+    df.index = np.concatenate(positions) if positions else np.empty(0, dtype=np.int64)
+    return df
+
+
+def load_data_sample(filepath: str, fraction: float, columns: List[str] = None,
+                     nrows: int = None, random_state: int = None, cache: bool = False,
+                     dtype: Dict[str, str] = None) -> Dict[str, pd.DataFrame]:
+    """
+    ファイルタイプを自動判別し、行を無作為抽出して読み込む
+
+    CSVはブロック単位で読み込みながら抽出するため、ファイル全体をメモリに
+    載せない。Excelは全体を読み込んでから抽出する。
+    行インデックスは元のファイル/シートでの行番号のまま保持する。
+
+    Args:
+        filepath: ファイルパス
+        fraction: 抽出する行の割合（0より大きく1以下）
+        columns: 読み込む列名のリスト（省略時は全列）
+        nrows: 抽出の対象とする先頭の行数（省略時は全行）
+        random_state: 乱数のシード（省略時は毎回異なる抽出になる）
+        cache: ExcelファイルをParquetキャッシュ経由で読み込むかどうか（load_excel_data を参照）
+        dtype: 列名をキーとした型指定の辞書（省略時は推論）
+
+    Returns:
+        シート名をキーとしたDataFrameの辞書
+
+    Raises:
+        ValueError: 抽出する割合が範囲外の場合
+    """
+    if not 0 < fraction <= 1:
+        raise ValueError(f"抽出する割合は0より大きく1以下で指定してください: {fraction}")
+
+    rng = np.random.default_rng(random_state)
+
+    if detect_file_type(filepath) == 'excel':
+        return {
+            sheet_name: df[rng.random(len(df)) < fraction]
+            for sheet_name, df in load_excel_data(filepath, cache=cache, columns=columns,
+                                                  nrows=nrows, dtype=dtype).items()
+        }
+
+    if pa is not None and dtype is None:
+        try:
+            return {Path(filepath).stem: _sample_csv_arrow(filepath, fraction, rng, columns, nrows)}
+        except (ValueError, TypeError, pa.ArrowException):
+            # 先頭ブロックから推論した型で読み込めない場合などはpandasで読み込む
+            pass
+
+    chunks = [
+        chunk[rng.random(len(chunk)) < fraction]
+        for chunk in pd.read_csv(filepath, usecols=columns, nrows=nrows, dtype=dtype,
+                                 chunksize=100_000)
+    ]
+    df = pd.concat(chunks) if chunks else pd.read_csv(filepath, usecols=columns, nrows=0,
+                                                      dtype=dtype)
+    return {Path(filepath).stem: df}
+
+
+def _null_result(series: pd.Series, null_mask: np.ndarray) -> Dict:
+    """
+    1列分のNullチェック結果を作成する
+
+    Args:
+        series: チェック対象の列
+        null_mask: series.isna() の結果（NumPy配列）
+
+    Returns:
+        Null数、Null率、Nullの行インデックスを含む辞書
+    """
+    null_count = null_mask.sum()
+    total_count = len(series)
+    null_ratio = null_count / total_count if total_count > 0 else 0
+    null_indices = _first_indices(series.index, null_mask)
+
+    return {
+        'null_count': int(null_count),
+        'total_count': int(total_count),
+        'null_ratio': float(null_ratio),
+        'null_indices': null_indices
+    }
+
+
+def _duplicate_stats(non_null_series: pd.Series) -> tuple:
+    """
+    1列分のユニーク数と重複している値を求める
+
+    Args:
+        non_null_series: Null値を除外済みの列
+
+    Returns:
+        (ユニーク数, 重複している値のリスト（昇順、最初の100件）) のタプル
+    """
+    if isinstance(non_null_series.dtype, pd.ArrowDtype):
+        # Arrow形式の列は1回のハッシュ集計でユニーク値と出現回数を同時に求める
+        value_counts = pc.value_counts(pa.array(non_null_series.array))
+        unique_count = len(value_counts)
+        duplicated = value_counts.field('values').filter(
+            pc.greater(value_counts.field('counts'), 1)
+        )
+        duplicated_values = duplicated.take(pc.sort_indices(duplicated))[:100].to_pylist()
+    else:
+        values = non_null_series.to_numpy()
+        try:
+            if values.dtype.kind not in 'biufO':
+                raise TypeError(values.dtype)
+            # 1回のソートでユニーク数と重複値（昇順）を同時に求める
+            uniq, counts = np.unique(values, return_counts=True)
+            unique_count = len(uniq)
+            duplicated_values = uniq[counts > 1][:100].tolist()
+        except TypeError:
+            # 日時型や、型が混在していて並べ替えできない列はpandasで処理する
+            unique_count = non_null_series.nunique()
+            duplicated_values = non_null_series[
+                non_null_series.duplicated(keep=False)
+            ].unique()[:100].tolist()
+
+    return unique_count, duplicated_values
+
+
+def _duplicate_result(non_null_series: pd.Series) -> Dict:
+    """
+    1列分の重複チェック結果を作成する
+
+    Args:
+        non_null_series: Null値を除外済みの列
+
+    Returns:
+        重複数、重複率、重複値を含む辞書
+    """
+    total_count = len(non_null_series)
+    unique_count, duplicated_values = _duplicate_stats(non_null_series)
+    duplicate_count = total_count - unique_count
+    duplicate_ratio = duplicate_count / total_count if total_count > 0 else 0
+
+    return {
+        'total_count': int(total_count),
+        'unique_count': int(unique_count),
+        'duplicate_count': int(duplicate_count),
+        'duplicate_ratio': float(duplicate_ratio),
+        'duplicated_values': duplicated_values  # 最初の100件まで記録
+    }
+
+
+def _mean_std_kernel(values):
+    """
+    平均と不偏標準偏差を1回の並列ループで求める（numbaでコンパイルして使用）
+
+    先頭の値を基準にずらした和と二乗和を集計することで、
+    桁落ちを抑えつつ各要素を1回だけ読み込む。
+    """
+    n = values.shape[0]
+    shift = values[0]
+    total = 0.0
+    total_sq = 0.0
+    for i in prange(n):
+        delta = values[i] - shift
+        total += delta
+        total_sq += delta * delta
+    mean = shift + total / n
+    std = np.sqrt(max(total_sq - total * total / n, 0.0) / (n - 1)) if n > 1 else np.nan
+    return mean, std
+
+
+def _outlier_mask_kernel(values, mean, cutoff):
+    """
+    |x - mean| > cutoff の判定を1回の並列ループで行う（numbaでコンパイルして使用）
+    """
+    mask = np.empty(values.shape[0], dtype=np.bool_)
+    for i in prange(values.shape[0]):
+        mask[i] = abs(values[i] - mean) > cutoff
+    return mask
+
+
+@lru_cache(maxsize=None)
+def _numba_kernels() -> tuple:
+    """
+    並列カーネルをコンパイルして返す
+
+    コンパイルするとnumbaのスレッドプールが起動し、その後にforkした子プロセスが
+    終了時に停止しなくなることがあるため、import時ではなく大きな列を
+    初めて処理するときにコンパイルする。
+
+    Returns:
+        (平均・標準偏差のカーネル, 異常値判定のカーネル) のタプル
+    """
+    # pandasから取得した配列は読み取り専用の場合があるため、読み取り専用の配列型で
+    # コンパイルする（書き込み可能な配列もこのシグネチャで受け付けられる）
+    float_array = types.Array(types.float64, 1, 'A', readonly=True)
+    mean_std = njit(types.UniTuple(types.float64, 2)(float_array),
+                    parallel=True, cache=True)(_mean_std_kernel)
+    outlier_mask = njit(types.boolean[:](float_array, types.float64, types.float64),
+                        parallel=True, cache=True)(_outlier_mask_kernel)
+    return mean_std, outlier_mask
+
+
+def _mean_std(values: np.ndarray) -> tuple:
+    """
+    平均と不偏標準偏差（pandasの std と同じ ddof=1）を求める
+
+    numbaがインストールされていて配列が大きい場合は、並列カーネルで
+    配列を1回だけ走査する。それ以外はNumPyで計算する。
+
+    Args:
+        values: Nullを含まないfloat64の1次元配列（空でないこと）
+
+    Returns:
+        (平均, 標準偏差) のタプル。要素が1つの場合、標準偏差はNaN
+    """
+    if njit is not None and len(values) >= _NUMBA_MIN_SIZE:
+        return _numba_kernels()[0](values)
+    std = values.std(ddof=1) if len(values) > 1 else np.nan
+    return values.mean(), std
+
+
+def _outlier_mask(values: np.ndarray, mean: float, cutoff: float) -> np.ndarray:
+    """
+    平均からの距離が cutoff を超える要素を判定する
+
+    numbaがインストールされていて配列が大きい場合はJITコンパイル済みの
+    並列カーネルを使用し、それ以外はNumPyで計算する。NaNは異常値としない。
+
+    Args:
+        values: float64の1次元配列
+        mean: 平均値
+        cutoff: 閾値（Zスコアの閾値 × 標準偏差）
+
+    Returns:
+        異常値の位置がTrueの真偽値配列
+    """
+    if njit is not None and len(values) >= _NUMBA_MIN_SIZE:
+        return _numba_kernels()[1](values, mean, cutoff)
+    return np.abs(values - mean) > cutoff
+
+
+def _outlier_summary(total_count: int, non_null_count: int, mean: float, std: float,
+                     threshold: float, outlier_count: int = 0, outlier_indices: list = None) -> Dict:
+    """
+    集計済みの統計量から1列分の異常値チェック結果を作成する
+
+    Args:
+        total_count: 元の列の行数
+        non_null_count: Null値を除いた値の数
+        mean: 平均値
+        std: 標準偏差（不偏）
+        threshold: Zスコアの閾値
+        outlier_count: 異常値の数
+        outlier_indices: 異常値の行インデックス（最初の100件）
+
+    Returns:
+        異常値数、異常値率、異常値の行インデックス、統計情報を含む辞書
+    """
+    if non_null_count == 0:
+        return {
+            'outlier_count': 0,
+            'total_count': 0,
+            'outlier_ratio': 0.0,
+            'outlier_indices': [],
+            'note': 'データなし'
+        }
+
+    if not std > 0:
+        # 標準偏差が0の場合（すべての値が同じ）
+        return {
+            'outlier_count': 0,
+            'total_count': total_count,
+            'outlier_ratio': 0.0,
+            'outlier_indices': [],
+            'mean': float(mean),
+            'std': 0.0,
+            'threshold': float(threshold),
+            'note': '標準偏差が0のため異常値なし'
+        }
+
+    outlier_ratio = outlier_count / total_count if total_count > 0 else 0
+
+    return {
+        'outlier_count': int(outlier_count),
+        'total_count': total_count,
+        'outlier_ratio': float(outlier_ratio),
+        'outlier_indices': list(outlier_indices or [])[:100],  # 最初の100件まで記録
+        'mean': float(mean),
+        'std': float(std),
+        'threshold': float(threshold)
+    }
+
+
+def _outlier_stats(non_null_series: pd.Series, threshold: float) -> tuple:
+    """
+    1列分の平均・標準偏差と異常値を求める（数値列のみ）
+
+    Args:
+        non_null_series: Null値を除外済みの数値列
+        threshold: Zスコアの閾値
+
+    Returns:
+        (平均, 標準偏差, 異常値数, 異常値の行インデックス（最初の100件）) のタプル。
+        データが無い場合や標準偏差が0の場合、異常値数は0
+    """
+    if len(non_null_series) == 0:
+        return np.nan, np.nan, 0, []
+
+    # Zスコアを計算（pandasの std と同じく不偏標準偏差）
+    values = non_null_series.to_numpy(dtype=np.float64)
+    mean, std = _mean_std(values)
+
+    if not std > 0:
+        return mean, std, 0, []
+
+    # |x - mean| > threshold * std で判定し、Zスコアの中間配列を作らない
+    outlier_mask = _outlier_mask(values, mean, threshold * std)
+
+    # 元のDataFrameでの行インデックスを取得
+    return mean, std, outlier_mask.sum(), _first_indices(non_null_series.index, outlier_mask)
+
+
+def _outlier_result(non_null_series: pd.Series, total_count: int, threshold: float) -> Dict:
+    """
+    1列分の異常値チェック結果を作成する（数値列のみ）
+
+    Args:
+        non_null_series: Null値を除外済みの数値列
+        total_count: 元の列の行数
+        threshold: Zスコアの閾値
+
+    Returns:
+        異常値数、異常値率、異常値の行インデックス、統計情報を含む辞書
+    """
+    mean, std, outlier_count, outlier_indices = _outlier_stats(non_null_series, threshold)
+    return _outlier_summary(total_count, len(non_null_series), mean, std, threshold,
+                            outlier_count, outlier_indices)
+
+
+# 数値型でない列に対する異常値チェック結果
+_NON_NUMERIC_OUTLIER_RESULT = {
+    'note': '数値型ではないためスキップ'
+}
+
+
+@lru_cache(maxsize=256)
+def _check_plan(dtypes: tuple) -> tuple:
+    """
+    列の型の組み合わせ（スキーマ）から、列ごとに必要なチェックを決める
+
+    同じスキーマのDataFrame（同じ構成のシートやファイル）では結果を再利用する。
+
+    Args:
+        dtypes: 各列のdtypeのタプル（df.dtypes の順）
+
+    Returns:
+        列ごとの (Nullを含み得るか, 数値型か) のタプル。
+        NumPyの整数型・真偽値型はNullを表現できないため、Nullチェックを省略できる。
+        真偽値型（bool[pyarrow] を含む）は0/1の数値として異常値チェックを行う
+    """
+    return tuple(
+        (not (isinstance(dtype, np.dtype) and dtype.kind in 'biu'),
+         pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype))
+        for dtype in dtypes
+    )
 
 
 def check_null(df: pd.DataFrame) -> Dict[str, Dict]:
@@ -101,19 +839,8 @@ def check_null(df: pd.DataFrame) -> Dict[str, Dict]:
     """
     result = {}
     
-    for column in df.columns:
-        null_mask = df[column].isna()
-        null_count = null_mask.sum()
-        total_count = len(df)
-        null_ratio = null_count / total_count if total_count > 0 else 0
-        null_indices = df[null_mask].index.tolist()
-        
-        result[column] = {
-            'null_count': int(null_count),
-            'total_count': int(total_count),
-            'null_ratio': float(null_ratio),
-            'null_indices': null_indices[:100]  # 最初の100件まで記録
-        }
+    for column, series in df.items():
+        result[column] = _null_result(series, series.isna().to_numpy())
     
     return result
 
@@ -130,24 +857,9 @@ def check_duplicates(df: pd.DataFrame) -> Dict[str, Dict]:
     """
     result = {}
     
-    for column in df.columns:
+    for column, series in df.items():
         # Null値を除外して重複をチェック
-        non_null_series = df[column].dropna()
-        total_count = len(non_null_series)
-        unique_count = non_null_series.nunique()
-        duplicate_count = total_count - unique_count
-        duplicate_ratio = duplicate_count / total_count if total_count > 0 else 0
-        
-        # 重複している値を取得
-        duplicated_values = non_null_series[non_null_series.duplicated(keep=False)].unique()
-        
-        result[column] = {
-            'total_count': int(total_count),
-            'unique_count': int(unique_count),
-            'duplicate_count': int(duplicate_count),
-            'duplicate_ratio': float(duplicate_ratio),
-            'duplicated_values': duplicated_values[:100].tolist()  # 最初の100件まで記録
-        }
+        result[column] = _duplicate_result(series.dropna())
     
     return result
 
@@ -166,69 +878,100 @@ def check_outliers(df: pd.DataFrame, threshold: float = 3.0) -> Dict[str, Dict]:
         列名をキーとした辞書。各列の異常値数、異常値率、異常値の行インデックスを含む
     """
     result = {}
+    total_count = len(df)
+    plan = _check_plan(tuple(df.dtypes))
     
-    for column in df.columns:
+    for (column, series), (_, is_numeric) in zip(df.items(), plan):
         # 数値型の列のみチェック
-        if pd.api.types.is_numeric_dtype(df[column]):
+        if is_numeric:
             # Null値を除外
-            non_null_series = df[column].dropna()
-            
-            if len(non_null_series) > 0:
-                # Zスコアを計算
-                mean = non_null_series.mean()
-                std = non_null_series.std()
-                
-                if std > 0:
-                    # Null値を除外したデータに対してZスコアを計算
-                    z_scores = np.abs((non_null_series - mean) / std)
-                    outlier_mask = z_scores > threshold
-                    outlier_count = outlier_mask.sum()
-                    
-                    # 元のDataFrameでの行インデックスを取得
-                    outlier_indices = non_null_series[outlier_mask].index.tolist()
-                    outlier_ratio = outlier_count / len(df) if len(df) > 0 else 0
-                    
-                    result[column] = {
-                        'outlier_count': int(outlier_count),
-                        'total_count': len(df),
-                        'outlier_ratio': float(outlier_ratio),
-                        'outlier_indices': outlier_indices[:100],  # 最初の100件まで記録
-                        'mean': float(mean),
-                        'std': float(std),
-                        'threshold': float(threshold)
-                    }
-                else:
-                    # 標準偏差が0の場合（すべての値が同じ）
-                    result[column] = {
-                        'outlier_count': 0,
-                        'total_count': len(df),
-                        'outlier_ratio': 0.0,
-                        'outlier_indices': [],
-                        'mean': float(mean),
-                        'std': 0.0,
-                        'threshold': float(threshold),
-                        'note': '標準偏差が0のため異常値なし'
-                    }
-            else:
-                result[column] = {
-                    'outlier_count': 0,
-                    'total_count': 0,
-                    'outlier_ratio': 0.0,
-                    'outlier_indices': [],
-                    'note': 'データなし'
-                }
+            result[column] = _outlier_result(series.dropna(), total_count, threshold)
         else:
             # 数値型でない列はスキップ
-            result[column] = {
-                'note': '数値型ではないためスキップ'
-            }
+            result[column] = dict(_NON_NUMERIC_OUTLIER_RESULT)
     
     return result
 
 
+def _build_check_results(columns: list, total_count: int, threshold: float,
+                         null_counts: np.ndarray, null_indices: list,
+                         unique_counts: np.ndarray, duplicated_values: list,
+                         numeric: np.ndarray, means: np.ndarray, stds: np.ndarray,
+                         outlier_counts: np.ndarray, outlier_indices: list) -> Dict:
+    """
+    列ごとの集計値の配列から全チェック結果の辞書を作成する
+
+    集計値は列方向の配列（1列につき1要素）で受け取り、比率はまとめて計算する。
+    列名をキーとした辞書への変換は出力時にここで1回だけ行う。
+
+    Args:
+        columns: 列名のリスト
+        total_count: 行数
+        threshold: 異常値判定のZスコア閾値
+        null_counts: 列ごとのNull数
+        null_indices: 列ごとのNullの行インデックスのリスト
+        unique_counts: 列ごとのユニーク数
+        duplicated_values: 列ごとの重複している値のリスト
+        numeric: 列ごとの数値型かどうか
+        means: 列ごとの平均値（数値列のみ）
+        stds: 列ごとの標準偏差（数値列のみ）
+        outlier_counts: 列ごとの異常値数（数値列のみ）
+        outlier_indices: 列ごとの異常値の行インデックスのリスト（数値列のみ）
+
+    Returns:
+        全チェック結果を含む辞書
+    """
+    null_counts = np.asarray(null_counts, dtype=np.int64)
+    unique_counts = np.asarray(unique_counts, dtype=np.int64)
+    non_null_counts = total_count - null_counts
+    duplicate_counts = non_null_counts - unique_counts
+
+    null_ratios = null_counts / total_count if total_count > 0 else np.zeros(len(columns))
+    duplicate_ratios = np.divide(duplicate_counts, non_null_counts,
+                                 out=np.zeros(len(columns)), where=non_null_counts > 0)
+
+    null_check = {}
+    duplicate_check = {}
+    outlier_check = {}
+
+    for i, column in enumerate(columns):
+        null_check[column] = {
+            'null_count': int(null_counts[i]),
+            'total_count': int(total_count),
+            'null_ratio': float(null_ratios[i]),
+            'null_indices': null_indices[i]  # 最初の100件まで記録
+        }
+        duplicate_check[column] = {
+            'total_count': int(non_null_counts[i]),
+            'unique_count': int(unique_counts[i]),
+            'duplicate_count': int(duplicate_counts[i]),
+            'duplicate_ratio': float(duplicate_ratios[i]),
+            'duplicated_values': duplicated_values[i]  # 最初の100件まで記録
+        }
+        if numeric[i]:
+            outlier_check[column] = _outlier_summary(
+                int(total_count), int(non_null_counts[i]), means[i], stds[i], threshold,
+                outlier_counts[i], outlier_indices[i]
+            )
+        else:
+            outlier_check[column] = dict(_NON_NUMERIC_OUTLIER_RESULT)
+
+    return {
+        'null_check': null_check,
+        'duplicate_check': duplicate_check,
+        'outlier_check': outlier_check
+    }
+
+
 def perform_checks(df: pd.DataFrame, outlier_threshold: float = 3.0) -> Dict:
     """
     データフレームに対して全てのチェックを実行
+
+    列ごとに1回だけ走査し、Nullマスクと Null除外済みの列を
+    3つのチェックで共有する。各列で必要なチェックはスキーマごとに
+    _check_plan で決め、Nullを含み得ない列ではNull判定を省略する。
+    集計値は列方向の配列に格納し、最後に _build_check_results で
+    結果の辞書に変換する。
     
     Args:
         df: チェック対象のDataFrame
@@ -237,14 +980,488 @@ def perform_checks(df: pd.DataFrame, outlier_threshold: float = 3.0) -> Dict:
     Returns:
         全チェック結果を含む辞書
     """
-    return {
-        'null_check': check_null(df),
-        'duplicate_check': check_duplicates(df),
-        'outlier_check': check_outliers(df, outlier_threshold)
-    }
+    columns = list(df.columns)
+    n_columns = len(columns)
+    total_count = len(df)
+    plan = _check_plan(tuple(df.dtypes))
+    numeric = np.array([is_numeric for _, is_numeric in plan], dtype=bool)
+
+    null_counts = np.zeros(n_columns, dtype=np.int64)
+    unique_counts = np.zeros(n_columns, dtype=np.int64)
+    means = np.full(n_columns, np.nan)
+    stds = np.full(n_columns, np.nan)
+    outlier_counts = np.zeros(n_columns, dtype=np.int64)
+    null_indices = []
+    duplicated_values = []
+    outlier_indices = []
+
+    for i, ((column, series), (nullable, _)) in enumerate(zip(df.items(), plan)):
+        if nullable:
+            null_mask = series.isna().to_numpy()
+            non_null_series = series[~null_mask]
+            null_counts[i] = null_mask.sum()
+            null_indices.append(_first_indices(series.index, null_mask))
+        else:
+            # Nullを表現できない型の列はそのまま使う
+            non_null_series = series
+            null_indices.append([])
+
+        unique_counts[i], duplicated = _duplicate_stats(non_null_series)
+        duplicated_values.append(duplicated)
+        if numeric[i]:
+            means[i], stds[i], outlier_counts[i], indices = _outlier_stats(
+                non_null_series, outlier_threshold
+            )
+            outlier_indices.append(indices)
+        else:
+            outlier_indices.append([])
+
+    return _build_check_results(
+        columns, total_count, outlier_threshold,
+        null_counts, null_indices, unique_counts, duplicated_values,
+        numeric, means, stds, outlier_counts, outlier_indices
+    )
+
+
+def _require_polars() -> None:
+    """
+    polarsがインストールされているか確認する
+
+    Raises:
+        ImportError: polarsがインストールされていない場合
+    """
+    if pl is None:
+        raise ImportError("engine='polars' を使用するには polars をインストールしてください")
+
+
+def load_data_polars(filepath: str, columns: List[str] = None, nrows: int = None,
+                     infer_schema_length: int = 100) -> Dict[str, "pl.LazyFrame"]:
+    """
+    ファイルタイプを自動判別してpolarsのLazyFrameとして読み込む
+
+    CSVは scan_csv による遅延読み込みとなり、列・行の絞り込みは
+    読み込み処理まで押し下げられる。
+
+    Args:
+        filepath: ファイルパス
+        columns: 読み込む列名のリスト（省略時は全列）
+        nrows: 先頭から読み込む行数（省略時は全行）
+        infer_schema_length: CSVの型推論に使用する先頭の行数（Noneの場合は全行）
+
+    Returns:
+        シート名をキーとしたLazyFrameの辞書
+    """
+    _require_polars()
+    file_type = detect_file_type(filepath)
+
+    if file_type == 'csv':
+        lazy_frames = {
+            Path(filepath).stem: pl.scan_csv(filepath, infer_schema_length=infer_schema_length)
+        }
+    else:  # excel
+        sheets = pl.read_excel(filepath, sheet_id=0)
+        lazy_frames = {sheet_name: df.lazy() for sheet_name, df in sheets.items()}
+
+    for sheet_name, lf in lazy_frames.items():
+        if columns is not None:
+            sheet_columns = lf.collect_schema().names()
+            lf = lf.select([column for column in sheet_columns if column in columns])
+        if nrows is not None:
+            lf = lf.head(nrows)
+        lazy_frames[sheet_name] = lf
+
+    return lazy_frames
+
+
+def perform_checks_polars(lf: "pl.LazyFrame", outlier_threshold: float = 3.0) -> Dict:
+    """
+    polarsのLazyFrameに対して全てのチェックを実行
+
+    全列の集計式を1つのクエリにまとめ、polarsのクエリオプティマイザで
+    列ごとに並列実行する。結果の形式は perform_checks と同じ。
 
+    Args:
+        lf: チェック対象のLazyFrame
+        outlier_threshold: 異常値判定のZスコア閾値
 
-def check_file(filepath: str, output_filepath: str = None, outlier_threshold: float = 3.0) -> Dict:
+    Returns:
+        全チェック結果を含む辞書
+    """
+    _require_polars()
+    schema = lf.collect_schema()
+    columns = schema.names()
+
+    # pandasと同様にNaNもNullとして扱う
+    normalized = [
+        pl.col(column).fill_nan(None) if dtype.is_float() else pl.col(column)
+        for column, dtype in schema.items()
+    ]
+
+    exprs = [pl.len().alias('__total__')]
+    row = pl.col(_ROW_INDEX_COLUMN)
+    for i, column in enumerate(columns):
+        col = pl.col(column)
+        non_null = col.drop_nulls()
+        exprs += [
+            col.null_count().alias(f'{i}__null'),
+            row.filter(col.is_null()).head(100).implode().alias(f'{i}__null_idx'),
+            non_null.n_unique().alias(f'{i}__uniq'),
+            non_null.filter(non_null.is_duplicated()).unique().sort()
+                .head(100).implode().alias(f'{i}__dup'),
+        ]
+        if schema[column].is_numeric() or schema[column] == pl.Boolean:
+            # 真偽値はpandasエンジンと同様に0/1の数値として扱う
+            values = col.cast(pl.Float64)
+            z_mask = ((values - values.mean()) / values.std()).abs() > outlier_threshold
+            exprs += [
+                values.mean().alias(f'{i}__mean'),
+                values.std().alias(f'{i}__std'),
+                z_mask.sum().alias(f'{i}__outlier'),
+                row.filter(z_mask).head(100).implode().alias(f'{i}__outlier_idx'),
+            ]
+
+    stats = (
+        lf.select(normalized)
+        .with_row_index(_ROW_INDEX_COLUMN)
+        .select(exprs)
+        .collect()
+        .row(0, named=True)
+    )
+
+    numeric = [f'{i}__mean' in stats for i in range(len(columns))]
+
+    def numeric_stat(i: int, name: str, default):
+        # 数値列以外や、値が無い列の統計量は None になる
+        value = stats.get(f'{i}__{name}')
+        return default if value is None else value
+
+    return _build_check_results(
+        columns, stats['__total__'], outlier_threshold,
+        [stats[f'{i}__null'] for i in range(len(columns))],
+        [stats[f'{i}__null_idx'] for i in range(len(columns))],
+        [stats[f'{i}__uniq'] for i in range(len(columns))],
+        [stats[f'{i}__dup'] for i in range(len(columns))],
+        numeric,
+        [numeric_stat(i, 'mean', np.nan) for i in range(len(columns))],
+        [numeric_stat(i, 'std', 0.0) for i in range(len(columns))],
+        [numeric_stat(i, 'outlier', 0) for i in range(len(columns))],
+        [numeric_stat(i, 'outlier_idx', []) for i in range(len(columns))]
+    )
+
+
+def _check_csv_polars(filepath: str, outlier_threshold: float = 3.0,
+                      columns: List[str] = None, nrows: int = None) -> Dict:
+    """
+    CSVファイルをpolarsエンジンでチェックする
+
+    型は先頭の行から推論し、後方に推論した型で読み込めない値があった場合のみ
+    全行から型を推論し直す（全行の推論はファイルの走査が1回増えるため）。
+
+    Args:
+        filepath: CSVファイルのパス
+        outlier_threshold: 異常値判定のZスコア閾値
+        columns: 読み込む列名のリスト（省略時は全列）
+        nrows: 先頭から読み込む行数（省略時は全行）
+
+    Returns:
+        全チェック結果を含む辞書
+    """
+    try:
+        (lf,) = load_data_polars(filepath, columns=columns, nrows=nrows).values()
+        return perform_checks_polars(lf, outlier_threshold)
+    except pl.exceptions.ComputeError:
+        (lf,) = load_data_polars(filepath, columns=columns, nrows=nrows,
+                                 infer_schema_length=None).values()
+        return perform_checks_polars(lf, outlier_threshold)
+
+
+def perform_checks_chunked(filepath: str, outlier_threshold: float = 3.0,
+                           chunksize: int = 100_000, dtype: Dict[str, str] = None,
+                           columns: List[str] = None, nrows: int = None) -> Dict:
+    """
+    CSVファイルをチャンク単位で読み込みながら全てのチェックを実行
+
+    ファイル全体をメモリに載せずに、2回の走査でチェックを行う。
+    1回目でNull数・重複・平均/分散（Welford法をチャンク単位で結合）を集計し、
+    2回目で確定した平均/標準偏差を使って異常値を検出する。
+    pyarrowがインストールされていて型指定が無い場合は、PyArrowのストリーミング
+    CSVリーダーで読み込む。
+    重複チェックのためにユニーク値は保持するため、メモリ使用量はユニーク値の数に比例する。
+    結果の形式は perform_checks と同じ。
+
+    Args:
+        filepath: CSVファイルのパス
+        outlier_threshold: 異常値判定のZスコア閾値
+        chunksize: 1チャンクあたりの行数
+        dtype: read_csv に渡す列の型指定（省略時は先頭の行から推定）
+        columns: 読み込む列名のリスト（省略時は全列）
+        nrows: 先頭から読み込む行数（省略時は全行）
+
+    Returns:
+        全チェック結果を含む辞書
+    """
+    if dtype is None and pa is not None:
+        # PyArrowのストリーミングリーダーは先頭ブロックで推論した型で全チャンクを読み込む
+        try:
+            return _perform_checks_chunks(
+                partial(_iter_csv_arrow_chunks, filepath, chunksize, nrows=nrows),
+                outlier_threshold, columns
+            )
+        except (ValueError, TypeError, pa.ArrowException):
+            # 後方に推論した型で読み込めない値がある場合などはpandasで読み込む
+            pass
+
+    if dtype is None:
+        # 型を固定してチャンクごとに型が変わらないようにする
+        inferred = infer_csv_dtypes(filepath, columns=columns)
+        try:
+            return perform_checks_chunked(filepath, outlier_threshold, chunksize=chunksize,
+                                          dtype=inferred, columns=columns, nrows=nrows)
+        except (ValueError, TypeError):
+            # 推定した型で読み込めない場合はpandasの型推論に任せる
+            dtype = {}
+
+    return _perform_checks_chunks(
+        partial(pd.read_csv, filepath, chunksize=chunksize, dtype=dtype, nrows=nrows),
+        outlier_threshold, columns
+    )
+
+
+def _merge_seen(s: Dict) -> None:
+    """
+    溜めておいたチャンクのユニーク値を、これまでに出現した値と照合してまとめる
+
+    既に出現していた値は重複値として記録し、初めて出現した値は初出の行番号とともに
+    出現済みの値に加える。
+
+    Args:
+        s: perform_checks_chunked の列ごとの集計値（'seen'・'pending'・'duplicated' を更新）
+    """
+    combined = pd.concat(([s['seen']] if s['seen'] is not None else []) + s['pending'])
+    repeated = combined.index.duplicated()
+    s['duplicated'].append(combined.index[repeated])
+    s['seen'] = combined[~repeated]
+    s['pending'] = []
+    s['pending_count'] = 0
+
+
+def _perform_checks_chunks(read_chunks, outlier_threshold: float,
+                           columns: List[str] = None) -> Dict:
+    """
+    チャンク単位で読み込んだデータに対して全てのチェックを実行（2回走査）
+
+    Args:
+        read_chunks: usecols を受け取り、DataFrameのチャンクを順に返す関数
+            （行インデックスは元のファイルでの行番号）
+        outlier_threshold: 異常値判定のZスコア閾値
+        columns: 読み込む列名のリスト（省略時は全列）
+
+    Returns:
+        全チェック結果を含む辞書
+    """
+    total_count = 0
+    stats = {}
+
+    # 1回目の走査: Null・重複・平均/分散
+    for chunk in read_chunks(usecols=columns):
+        total_count += len(chunk)
+        for column, series in chunk.items():
+            s = stats.setdefault(column, {
+                'null_count': 0, 'null_indices': [],
+                'seen': None, 'pending': [], 'pending_count': 0, 'duplicated': [],
+                'numeric': True, 'n': 0, 'mean': 0.0, 'm2': 0.0,
+                'outlier_count': 0, 'outlier_indices': []
+            })
+            null_mask = series.isna().to_numpy()
+            null_count = int(null_mask.sum())
+            s['null_count'] += null_count
+            if len(s['null_indices']) < 100 and null_count:
+                s['null_indices'] += series.index[np.flatnonzero(null_mask)[:100]].tolist()
+
+            non_null = series[~null_mask]
+            in_chunk_dup = non_null.duplicated()
+            first = non_null[~in_chunk_dup]
+            # チャンク内のユニーク値は、値をインデックス・初出の行番号を値として溜めておき、
+            # 溜めた数がそれまでのユニーク値の数を超えたらまとめて照合する
+            s['pending'].append(pd.Series(first.index, index=pd.Index(first.array)))
+            s['pending_count'] += len(first)
+            s['duplicated'].append(pd.Index(non_null[in_chunk_dup].unique()))
+            if s['seen'] is None or s['pending_count'] >= len(s['seen']):
+                _merge_seen(s)
+
+            s['numeric'] = s['numeric'] and (pd.api.types.is_numeric_dtype(series)
+                                             or pd.api.types.is_bool_dtype(series))
+            if s['numeric'] and len(non_null) > 0:
+                # チャンクごとの平均/偏差平方和を結合（Chanらの並列Welford法）
+                values = non_null.to_numpy(dtype=np.float64)
+                n_b = len(values)
+                mean_b, std_b = _mean_std(values)
+                m2_b = std_b ** 2 * (n_b - 1) if n_b > 1 else 0.0
+                n = s['n'] + n_b
+                delta = mean_b - s['mean']
+                s['mean'] += delta * n_b / n
+                s['m2'] += m2_b + delta ** 2 * s['n'] * n_b / n
+                s['n'] = n
+
+    for s in stats.values():
+        _merge_seen(s)
+        s['std'] = np.sqrt(s['m2'] / (s['n'] - 1)) if s['n'] > 1 else np.nan
+
+    # 2回目の走査: 異常値
+    outlier_columns = [c for c, s in stats.items() if s['numeric'] and s['std'] > 0]
+    if outlier_columns:
+        for chunk in read_chunks(usecols=outlier_columns):
+            for column, series in chunk.items():
+                s = stats[column]
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                outlier_mask = _outlier_mask(values, s['mean'], outlier_threshold * s['std'])
+                s['outlier_count'] += int(outlier_mask.sum())
+                if len(s['outlier_indices']) < 100:
+                    s['outlier_indices'] += series.index[np.flatnonzero(outlier_mask)[:100]].tolist()
+
+    columns = list(stats)
+    values = list(stats.values())
+
+    duplicated_values = []
+    for s in values:
+        duplicated = s['duplicated'][0].append(s['duplicated'][1:]).unique()
+        try:
+            # 他の方法と同じく昇順に並べる
+            duplicated_values.append(sorted(duplicated.tolist())[:100])
+        except TypeError:
+            # 並べ替えできない値が混在している場合は初出順
+            first_positions = s['seen'].reindex(duplicated).sort_values()
+            duplicated_values.append(first_positions.index[:100].tolist())
+
+    return _build_check_results(
+        columns, total_count, outlier_threshold,
+        [s['null_count'] for s in values], [s['null_indices'][:100] for s in values],
+        [len(s['seen']) for s in values], duplicated_values,
+        [s['numeric'] for s in values], [s['mean'] for s in values],
+        [s['std'] for s in values], [s['outlier_count'] for s in values],
+        [s['outlier_indices'][:100] for s in values]
+    )
+
+
+def _require_cudf() -> None:
+    """
+    cudfがインストールされているか確認する
+
+    Raises:
+        ImportError: cudfがインストールされていない場合
+    """
+    if cudf is None:
+        raise ImportError("engine='cudf' を使用するには cudf（RAPIDS）をインストールしてください")
+
+
+def load_data_cudf(filepath: str, columns: List[str] = None,
+                   nrows: int = None) -> Dict[str, "cudf.DataFrame"]:
+    """
+    ファイルタイプを自動判別してcudfのDataFrame（GPUメモリ上）として読み込む
+
+    CSVはGPU上で直接解析する。ExcelはcudfではGPU上で読み込めないため、
+    pandasで読み込んだ後にGPUへ転送する。
+
+    Args:
+        filepath: ファイルパス
+        columns: 読み込む列名のリスト（省略時は全列）
+        nrows: 先頭から読み込む行数（省略時は全行）
+
+    Returns:
+        シート名をキーとしたcudfのDataFrameの辞書
+    """
+    _require_cudf()
+    file_type = detect_file_type(filepath)
+
+    if file_type == 'csv':
+        return {Path(filepath).stem: cudf.read_csv(filepath, usecols=columns, nrows=nrows)}
+    else:  # excel
+        data_dict = load_excel_data(filepath, columns=columns, nrows=nrows)
+        return {sheet_name: cudf.from_pandas(df) for sheet_name, df in data_dict.items()}
+
+
+def _cudf_first_indices(mask: "cudf.Series", limit: int = 100) -> list:
+    """
+    cudfの真偽値Seriesで True の行インデックスを先頭から limit 件までCPU側に取得する
+
+    Args:
+        mask: 対象の位置がTrueの真偽値Series
+        limit: 返す最大件数
+
+    Returns:
+        行インデックスのリスト
+    """
+    return mask[mask].index[:limit].to_pandas().tolist()
+
+
+def perform_checks_cudf(gdf: "cudf.DataFrame", outlier_threshold: float = 3.0) -> Dict:
+    """
+    cudfのDataFrameに対して全てのチェックをGPU上で実行
+
+    Null数と、数値列の平均・標準偏差・異常値数は全列まとめて計算する。
+    GPUから転送するのは列ごとの集計値と、記録する最初の100件のみ。
+    結果の形式は perform_checks と同じ。
+
+    Args:
+        gdf: チェック対象のcudfのDataFrame
+        outlier_threshold: 異常値判定のZスコア閾値
+
+    Returns:
+        全チェック結果を含む辞書
+    """
+    _require_cudf()
+    columns = list(gdf.columns)
+    total_count = len(gdf)
+
+    # 全列のNull数、数値列の平均・標準偏差・異常値をまとめて計算する
+    null_mask = gdf.isna()
+    null_counts = null_mask.sum().to_pandas()
+    # 真偽値は他のエンジンと同様に0/1の数値として扱う
+    numeric_gdf = gdf.select_dtypes(include=['number', 'bool']).astype('float64')
+    means = numeric_gdf.mean()
+    stds = numeric_gdf.std()
+    outlier_mask = (((numeric_gdf - means).abs() / stds) > outlier_threshold).fillna(False)
+    outlier_counts = outlier_mask.sum().to_pandas()
+    means = means.to_pandas()
+    stds = stds.to_pandas()
+
+    numeric = [column in numeric_gdf.columns for column in columns]
+    null_indices = []
+    unique_counts = []
+    duplicated_values = []
+    outlier_indices = []
+
+    for column, is_numeric in zip(columns, numeric):
+        null_indices.append(_cudf_first_indices(null_mask[column]))
+
+        value_counts = gdf[column].value_counts()
+        unique_counts.append(len(value_counts))
+        duplicated = value_counts[value_counts > 1].sort_index()
+        duplicated_values.append(duplicated.index[:100].to_pandas().tolist())
+
+        if is_numeric:
+            outlier_indices.append(_cudf_first_indices(outlier_mask[column]))
+        else:
+            outlier_indices.append([])
+
+    return _build_check_results(
+        columns, total_count, outlier_threshold,
+        [null_counts[column] for column in columns], null_indices,
+        unique_counts, duplicated_values,
+        numeric,
+        [means.get(column, np.nan) for column in columns],
+        # 平均からの距離がすべて0の列（標準偏差0）は _outlier_summary で異常値なしとなる
+        [np.nan_to_num(stds.get(column, np.nan)) for column in columns],
+        [outlier_counts.get(column, 0) for column in columns],
+        outlier_indices
+    )
+
+
+def check_file(filepath: str, output_filepath: str = None, outlier_threshold: float = 3.0,
+               engine: str = 'pandas', chunksize: int = None, cache: bool = False,
+               columns: List[str] = None, nrows: int = None,
+               dtype: Dict[str, str] = None, max_workers: int = None,
+               sample: float = None, random_state: int = None) -> Dict:
     """
     ファイルのデータチェックを実行し、結果を出力
     
@@ -252,17 +1469,79 @@ def check_file(filepath: str, output_filepath: str = None, outlier_threshold: fl
         filepath: チェック対象のファイルパス
         output_filepath: 結果出力先のファイルパス（省略時は自動生成）
         outlier_threshold: 異常値判定のZスコア閾値
+        engine: 'pandas'、'polars'（大きなファイル向けの遅延実行）、
+            または 'cudf'（GPUで実行。cudfが必要）
+        chunksize: 指定した場合、CSVをこの行数ごとに読み込んでチェックする（pandasのみ）
+        cache: Excelファイルの読み込みにParquetキャッシュを使用するかどうか（pandasのみ）
+        columns: チェック対象の列名のリスト（省略時は全列）。指定した列のみ読み込む
+        nrows: 先頭からチェックする行数（省略時は全行）
+        dtype: 列名をキーとした型指定の辞書（pandasのみ。省略時はCSVは先頭の行から推定）
+        max_workers: 指定した場合、複数シートのExcelファイルをこのプロセス数で
+            並列にチェックする（pandasのみ。省略時は逐次実行）。ワーカーは
+            forkserver/spawnで起動するため、スクリプトから呼び出す場合は
+            if __name__ == "__main__": の中で実行すること
+        sample: 指定した場合、この割合の行を無作為抽出してチェックする（pandasのみ。
+            chunksize とは併用できない）。件数・比率は抽出した行に対する値となり、各シートの結果に
+            'estimate': True と 'sample_fraction' が付く
+        random_state: sample を指定した場合の乱数のシード（省略時は毎回異なる抽出になる）
         
     Returns:
         全チェック結果を含む辞書
+        
+    Raises:
+        ValueError: サポートされていないエンジンの場合、
+            または pandas 以外のエンジンや chunksize と同時に sample を指定した場合
     """
-    # データを読み込み
-    data_dict = load_data(filepath)
-    
-    # 各シート/ファイルに対してチェックを実行
+    if engine == 'pandas':
+        load, check = partial(load_data, cache=cache, dtype=dtype), perform_checks
+    elif engine == 'polars':
+        load, check = load_data_polars, perform_checks_polars
+    elif engine == 'cudf':
+        load, check = load_data_cudf, perform_checks_cudf
+    else:
+        raise ValueError(f"サポートされていないエンジン: {engine}")
+
+    if sample is not None:
+        if engine != 'pandas':
+            raise ValueError(f"sample は engine='pandas' でのみ指定できます: {engine}")
+        if chunksize is not None:
+            raise ValueError("sample と chunksize は同時に指定できません")
+        # 抽出した行だけを読み込む
+        load = partial(load_data_sample, fraction=sample, random_state=random_state,
+                       cache=cache, dtype=dtype)
+
     results = {}
-    for sheet_name, df in data_dict.items():
-        results[sheet_name] = perform_checks(df, outlier_threshold)
+    if chunksize is not None and engine == 'pandas' and detect_file_type(filepath) == 'csv':
+        # ファイル全体を読み込まずにチャンク単位でチェック
+        results[Path(filepath).stem] = perform_checks_chunked(
+            filepath, outlier_threshold, chunksize=chunksize, dtype=dtype,
+            columns=columns, nrows=nrows
+        )
+    elif engine == 'polars' and detect_file_type(filepath) == 'csv':
+        results[Path(filepath).stem] = _check_csv_polars(
+            filepath, outlier_threshold, columns=columns, nrows=nrows
+        )
+    else:
+        # データを読み込み
+        data_dict = load(filepath, columns=columns, nrows=nrows)
+
+        # 各シート/ファイルに対してチェックを実行
+        if max_workers is not None and engine == 'pandas' and len(data_dict) > 1:
+            # シートごとのチェックは独立しているため、別プロセスで並列に実行する。
+            # ネイティブのスレッドプールを持つプロセスをforkしないよう、forkserverで起動する
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=_POOL_CONTEXT) as executor:
+                checked = executor.map(partial(check, outlier_threshold=outlier_threshold),
+                                       data_dict.values())
+                results = dict(zip(data_dict.keys(), checked))
+        else:
+            for sheet_name, df in data_dict.items():
+                results[sheet_name] = check(df, outlier_threshold)
+
+        if sample is not None:
+            for sheet_result in results.values():
+                sheet_result['estimate'] = True
+                sheet_result['sample_fraction'] = float(sample)
     
     # 出力ファイルパスを決定
     if output_filepath is None:
@@ -270,8 +1549,17 @@ def check_file(filepath: str, output_filepath: str = None, outlier_threshold: fl
         output_filepath = input_path.parent / f"{input_path.stem}_check_result.json"
     
     # 結果をJSON形式で出力
-    with open(output_filepath, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    # 日付など標準のjsonで扱えない値は、どちらの出力方法でも str() で文字列にする
+    if orjson is not None:
+        Path(output_filepath).write_bytes(orjson.dumps(
+            results,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        ))
+    else:
+        with open(output_filepath, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2, default=str)
     
     print(f"チェック結果を {output_filepath} に出力しました。")
     
@@ -281,18 +1569,24 @@ def check_file(filepath: str, output_filepath: str = None, outlier_threshold: fl
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) < 2:
-        print("使用方法: python data_checker.py <ファイルパス> [出力ファイルパス] [異常値閾値]")
+    # --gpu が指定された場合はcudfエンジン（GPU）でチェックする
+    use_gpu = '--gpu' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--gpu']
+    
+    if len(args) < 1:
+        print("使用方法: python data_checker.py <ファイルパス> [出力ファイルパス] [異常値閾値] [--gpu]")
         print("例: python data_checker.py data.csv")
         print("例: python data_checker.py data.xlsx output.json 3.0")
+        print("例: python data_checker.py large_data.csv --gpu")
         sys.exit(1)
     
-    filepath = sys.argv[1]
-    output_filepath = sys.argv[2] if len(sys.argv) > 2 else None
-    outlier_threshold = float(sys.argv[3]) if len(sys.argv) > 3 else 3.0
+    filepath = args[0]
+    output_filepath = args[1] if len(args) > 1 else None
+    outlier_threshold = float(args[2]) if len(args) > 2 else 3.0
+    engine = 'cudf' if use_gpu else 'pandas'
     
     try:
-        check_file(filepath, output_filepath, outlier_threshold)
+        check_file(filepath, output_filepath, outlier_threshold, engine=engine)
     except Exception as e:
         print(f"エラーが発生しました: {e}")
         sys.exit(1)
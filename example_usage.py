@@ -101,6 +101,25 @@ def example_create_excel():
     print("\n完了しました。結果ファイルを確認してください。\n")
 
 
+def example_date_column():
+    """日付の列を含むCSVファイルをチェックする例"""
+    print("=" * 60)
+    print("例4: 日付の列を含むファイルのチェック")
+    print("=" * 60)
+    
+    # 日付の列は文字列のまま読み込まれ、重複値も文字列で記録される
+    pd.DataFrame({
+        '日付': ['2024-01-01', '2024-01-01', '2024-01-02', None],
+        '件数': [10, 12, 11, 13]
+    }).to_csv('sample_dates.csv', index=False)
+    
+    results = check_file("sample_dates.csv")
+    duplicated_values = results['sample_dates']['duplicate_check']['日付']['duplicated_values']
+    assert duplicated_values == ['2024-01-01'], duplicated_values
+    
+    print("\n完了しました。結果ファイルを確認してください。\n")
+
+
 if __name__ == "__main__":
     print("\nデータチェッカーの使用例\n")
     
@@ -114,6 +133,9 @@ if __name__ == "__main__":
         # 例3: Excelファイルのチェック
         example_create_excel()
         
+        # 例4: 日付の列を含むファイル
+        example_date_column()
+        
         print("=" * 60)
         print("すべての例が正常に実行されました！")
         print("=" * 60)